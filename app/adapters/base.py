@@ -3,9 +3,9 @@ from typing import Any, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AdapterResponse:
-    """Response from adapter."""
+    """Response from adapter. Immutable; slots keep per-instance overhead low."""
     data: Any
     status_code: int
     latency_ms: int
@@ -11,8 +11,22 @@ def register_adapter(name: str, adapter_class: Type[SportsProvider]):
     _adapter_registry[name] = adapter_class
 
 
-async def get_adapter(name: str, settings) -> SportsProvider:
-    """Get or create adapter instance."""
-    if name not in _adapters:
-        _adapters[name] = _adapter_registry[name](settings)
-    return _adapters[name]
\ No newline at end of file
+def get_adapter(name: str, settings) -> SportsProvider:
+    """
+    Get or create adapter instance.
+
+    Synchronous on purpose: construction never awaits, so on a single
+    event loop the check-then-create below cannot interleave and needs
+    no lock — and callers skip a coroutine per lookup.
+    """
+    adapter = _adapters.get(name)
+    if adapter is None:
+        adapter = _adapters[name] = _adapter_registry[name](settings)
+    return adapter
+
+
+async def close_adapters():
+    """Close all instantiated adapters (called on shutdown)."""
+    for adapter in _adapters.values():
+        await adapter.close()
+    _adapters.clear()
@@ -1,7 +1,9 @@
 import httpx
+import orjson
 import time
 import asyncio
-from typing import Optional
+from typing import Dict, Optional
+from cachetools import TTLCache
 from app.adapters.base import SportsProvider, AdapterResponse
 from app.utils.backoff import exponential_backoff
 from app.utils.rate_limiter import RateLimiter, check_rate_limit
@@ -22,103 +24,158 @@ class OpenLigaDBAdapter(SportsProvider):
         self.rate_limiter = RateLimiter(limit, window)
         self.base_url = settings.OPENLIGADB_BASE_URL
         self.timeout = settings.OPENLIGADB_TIMEOUT
-        self.client = None
-    
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client."""
-        if self.client is None:
-            self.client = httpx.AsyncClient(timeout=self.timeout)
-        return self.client
-    
-    async def _fetch(self, url: str, retry_count: int = 0) -> AdapterResponse:
+        self._timeout_ms = int(self.timeout * 1000)
+        # Bound once: pydantic-settings attribute access is several dict
+        # lookups deep, too slow to repeat per retry iteration.
+        self._max_retries = settings.BACKOFF_MAX_RETRIES
+        self._base_delay = settings.BACKOFF_BASE_DELAY
+        self._max_delay = settings.BACKOFF_MAX_DELAY
+        self._jitter = settings.BACKOFF_JITTER
+        # Single pooled client for the whole adapter lifetime: all requests
+        # target one host, so keep-alive connections skip the TCP+TLS
+        # handshake and HTTP/2 multiplexes concurrent calls.
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            http2=True,
+            # Match lists are verbose JSON; brotli cuts bytes-on-wire
+            # well beyond httpx's default gzip.
+            headers={"Accept-Encoding": "br, gzip"},
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0
+            )
+        )
+        # Concurrent identical requests share one upstream call; recent
+        # successful responses are served from a short-lived cache.
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._cache: TTLCache = TTLCache(maxsize=1024, ttl=5)
+
+    async def _fetch(self, url: str) -> AdapterResponse:
+        """
+        Fetch data from OpenLiga, coalescing duplicate in-flight requests.
+
+        The first caller for a URL starts the real upstream fetch; any
+        caller arriving while it is in flight awaits the same task instead
+        of spending another rate-limit token and round-trip. Successful
+        responses are cached for a few seconds since league/team data
+        barely changes.
+        """
+        cached = self._cache.get(url)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._fetch_upstream(url))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+
+        response = await task
+
+        if response.status_code == 200:
+            self._cache[url] = response
+
+        return response
+
+    async def _fetch_upstream(self, url: str) -> AdapterResponse:
         """
         Fetch data from OpenLiga with exponential backoff retry logic.
+
+        Retries run in a loop rather than by recursing, so a call uses one
+        coroutine frame no matter how many attempts it takes.
+
+        The rate limit is checked here — after the TTL cache and the
+        in-flight coalescer in _fetch — so tokens are only spent on
+        attempts that actually go out on the network.
         """
-        await check_rate_limit(self.rate_limiter, "openliga")
-        client = await self._get_client()
-        
-        try:
-            start_time = time.perf_counter()
-            response = await client.get(url, follow_redirects=True)
-            latency_ms = int((time.perf_counter() - start_time) * 1000)
-            
+        max_retries = self._max_retries
+
+        for retry_count in range(max_retries + 1):
+            await check_rate_limit(self.rate_limiter, "openliga")
+
+            try:
+                start_ns = time.perf_counter_ns()
+                response = await self.client.get(url, follow_redirects=True)
+                latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+            except httpx.TimeoutException:
+                if retry_count < max_retries:
+                    logger.info(
+                        "upstream_timeout_retry",
+                        retry_count=retry_count
+                    )
+
+                    delay = exponential_backoff(
+                        retry_count,
+                        base_delay=self._base_delay,
+                        max_delay=self._max_delay,
+                        jitter=self._jitter
+                    )
+
+                    await asyncio.sleep(delay)
+                    continue
+
+                return AdapterResponse(
+                    data={"error": "Request timeout"},
+                    status_code=504,
+                    latency_ms=self._timeout_ms,
+                    upstream_url=f"{self.base_url}{url}"
+                )
+
             if response.status_code == 200:
                 return AdapterResponse(
-                    data=response.json(),
+                    data=orjson.loads(response.content),
                     status_code=response.status_code,
                     latency_ms=latency_ms,
-                    upstream_url=url
+                    upstream_url=f"{self.base_url}{url}"
                 )
-            
+
             # Retry logic for transient errors (429, 5xx)
-            if response.status_code in [429, 500, 502, 503, 504] and retry_count < self.settings.BACKOFF_MAX_RETRIES:
-                await logger.ainfo(
+            if response.status_code in [429, 500, 502, 503, 504] and retry_count < max_retries:
+                logger.info(
                     "upstream_error_retry",
                     status_code=response.status_code,
                     retry_count=retry_count
                 )
-                
+
                 delay = exponential_backoff(
                     retry_count,
-                    base_delay=self.settings.BACKOFF_BASE_DELAY,
-                    max_delay=self.settings.BACKOFF_MAX_DELAY,
-                    jitter=self.settings.BACKOFF_JITTER
+                    base_delay=self._base_delay,
+                    max_delay=self._max_delay,
+                    jitter=self._jitter
                 )
-                
+
                 await asyncio.sleep(delay)
-                return await self._fetch(url, retry_count + 1)
-            
+                continue
+
             # Non-retryable error
             return AdapterResponse(
                 data={"error": f"API error: {response.status_code}"},
                 status_code=response.status_code,
                 latency_ms=latency_ms,
-                upstream_url=url
-            )
-            
-        except asyncio.TimeoutError:
-            if retry_count < self.settings.BACKOFF_MAX_RETRIES:
-                await logger.ainfo(
-                    "upstream_timeout_retry",
-                    retry_count=retry_count
-                )
-                
-                delay = exponential_backoff(
-                    retry_count,
-                    base_delay=self.settings.BACKOFF_BASE_DELAY,
-                    max_delay=self.settings.BACKOFF_MAX_DELAY,
-                    jitter=self.settings.BACKOFF_JITTER
-                )
-                
-                await asyncio.sleep(delay)
-                return await self._fetch(url, retry_count + 1)
-            
-            return AdapterResponse(
-                data={"error": "Request timeout"},
-                status_code=504,
-                latency_ms=int(self.timeout * 1000),
-                upstream_url=url
+                upstream_url=f"{self.base_url}{url}"
             )
     
     async def list_leagues(self) -> AdapterResponse:
         """Get all available leagues."""
-        url = f"{self.base_url}/api/getavailableleagues"
+        url = "/api/getavailableleagues"
         return await self._fetch(url)
     
     async def get_league_matches(self, league_id: int, season: Optional[int] = None) -> AdapterResponse:
         """Get matches for a specific league."""
-        url = f"{self.base_url}/api/getmatchdata/{league_id}/{season}"
-        
+        url = "/api/getmatchdata/%s/%s" % (league_id, season)
         return await self._fetch(url)
     
     async def get_team(self, team_id: int) -> AdapterResponse:
         """Get team information."""
-        url = f"{self.base_url}/api/getteam/{team_id}"
+        url = "/api/getteam/%s" % team_id
         return await self._fetch(url)
     
     async def get_matches_between_teams(self, team_id1: int, team_id2: int) -> AdapterResponse:
         """Get match data between two specific teams."""
-        url = f"{self.base_url}/api/getmatchdata/{team_id1}/{team_id2}"
+        url = "/api/getmatchdata/%s/%s" % (team_id1, team_id2)
         return await self._fetch(url)
     
     async def close(self):
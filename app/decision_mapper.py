@@ -1,43 +1,59 @@
+import sys
+from typing import Callable, Optional, Tuple
 from pydantic import BaseModel
 from app.adapters.base import AdapterResponse
+from app.models.requests import OPERATION_PAYLOAD_VALIDATORS
+from app.normalizers import normalize_leagues, normalize_matches
 
 
 class DecisionMapper:
     def __init__(self, adapter):
         self.adapter = adapter
-        
-        self._routes = {
-            "ListLeagues": (
-                adapter.list_leagues,
-                {} 
+
+        # Precompiled dispatch table: each entry fuses the payload
+        # validator and a closure with the adapter method bound and the
+        # payload-field access inlined, so one dict lookup per request
+        # resolves validation, execution and normalization. The validator entry is
+        # the bound validate_python itself — attribute resolution happens
+        # here once, not per request. Keys are interned so the lookup
+        # hits CPython's pointer-equality fast path. The third slot is
+        # the normalizer, or None for operations whose responses are
+        # already canonical — those skip the per-item walk entirely.
+        self._dispatch = {
+            sys.intern("ListLeagues"): (
+                OPERATION_PAYLOAD_VALIDATORS["ListLeagues"].validate_python,
+                lambda p, m=adapter.list_leagues: m(),
+                normalize_leagues
             ),
-            "GetLeagueMatches": (
-                adapter.get_league_matches,
-                {"leagueId": "league_id", "season": "season"}
+            sys.intern("GetLeagueMatches"): (
+                OPERATION_PAYLOAD_VALIDATORS["GetLeagueMatches"].validate_python,
+                lambda p, m=adapter.get_league_matches: m(
+                    league_id=p.leagueId, season=p.season
+                ),
+                normalize_matches
             ),
-            "GetTeam": (
-                adapter.get_team,
-                {"teamId": "team_id"}
+            sys.intern("GetTeam"): (
+                OPERATION_PAYLOAD_VALIDATORS["GetTeam"].validate_python,
+                lambda p, m=adapter.get_team: m(team_id=p.teamId),
+                None
             ),
-            "GetMatch": (
-                adapter.get_matches_between_teams,
-                {"teamId1": "team_id1", "teamId2": "team_id2"}
+            sys.intern("GetMatch"): (
+                OPERATION_PAYLOAD_VALIDATORS["GetMatch"].validate_python,
+                lambda p, m=adapter.get_matches_between_teams: m(
+                    team_id1=p.teamId1, team_id2=p.teamId2
+                ),
+                normalize_matches
             ),
         }
-    
+
+    def dispatch(self, operation_type: str) -> Optional[Tuple[Callable, Callable, Optional[Callable]]]:
+        """Get the (validate_fn, executor, normalizer) entry for an operation, or None if unknown."""
+        return self._dispatch.get(operation_type)
+
     async def execute(
-        self, 
-        operation_type: str, 
-        validated_payload: BaseModel 
+        self,
+        operation_type: str,
+        validated_payload: BaseModel
     ) -> AdapterResponse:
         """Execute adapter method with already validated payload."""
-        method, field_mapping = self._routes[operation_type]
-        
-        kwargs = {
-            param_name: getattr(validated_payload, payload_field)
-            for payload_field, param_name in field_mapping.items()
-        }
-        
-        return await method(**kwargs)
-    
-    
\ No newline at end of file
+        return await self._dispatch[operation_type][1](validated_payload)
@@ -0,0 +1,14 @@
+class ProxyError(Exception):
+    """
+    Proxy error carrying a ready-to-serialize response body.
+
+    Raising this instead of HTTPException skips Starlette's exception
+    plumbing (headers handling, detail introspection) — the app-level
+    handler just wraps body in an ORJSONResponse.
+    """
+
+    __slots__ = ("status_code", "body")
+
+    def __init__(self, status_code: int, body: dict):
+        self.status_code = status_code
+        self.body = body
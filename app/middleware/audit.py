@@ -1,8 +1,9 @@
 import time
-import json
-import uuid
+import orjson
 import structlog
-from typing import Callable
+from contextvars import ContextVar
+from os import urandom
+from typing import Callable, Optional
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from app.config import settings
@@ -10,28 +11,65 @@ from fastapi.responses import StreamingResponse, FileResponse
 
 logger = structlog.get_logger()
 
+_UNSAFE_HEADERS = frozenset({"authorization", "x-api-key", "cookie", "x-token"})
+
+# Resolved once per request in dispatch; downstream code (exception
+# handlers, route logging) reads it from here instead of re-scanning the
+# Headers list.
+REQUEST_ID_CTX: ContextVar[str] = ContextVar("request_id", default="unknown")
+
 
 class AuditMiddleware(BaseHTTPMiddleware):
-    
+
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.perf_counter()
-        
-        request_id = await self._get_or_generate_request_id(request)
+        start_ns = time.perf_counter_ns()
+
         method = request.method
         path = request.url.path
-        
-        await self._log_inbound(request, request_id, method, path)
-        
+
+        # Read the body exactly once and replay it for downstream readers,
+        # instead of each helper (and the route handler) re-consuming it.
+        # Content-Length tells us the size for free; only small JSON bodies
+        # are worth pulling into memory here (requestId + preview) — large
+        # uploads are left on the wire for the route handler.
+        body = b""
+        parsed_body = None
+        body_size = 0
+        if method in ["POST", "PUT", "PATCH"]:
+            body_size = int(request.headers.get("content-length") or 0)
+            content_type = request.headers.get("content-type", "")
+
+            if 0 < body_size <= settings.LOG_BODY_LIMIT and "json" in content_type:
+                body = await request.body()
+
+                async def receive():
+                    return {"type": "http.request", "body": body, "more_body": False}
+
+                request._receive = receive
+
+                try:
+                    parsed_body = orjson.loads(body)
+                except orjson.JSONDecodeError:
+                    parsed_body = None
+
+        request.state.raw_body = body
+        request.state.parsed_body = parsed_body
+
+        request_id = self._get_or_generate_request_id(request, parsed_body)
+        REQUEST_ID_CTX.set(request_id)
+
+        self._log_inbound(request, request_id, method, path, body, body_size)
+
         try:
             response = await call_next(request)
-            latency_ms = int((time.perf_counter() - start_time) * 1000)
-            await self._log_outbound(response, request_id, latency_ms)
-            
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            self._log_outbound(response, request_id, latency_ms)
+
             return response
-        
+
         except Exception as e:
-            latency_ms = int((time.perf_counter() - start_time) * 1000)
-            await logger.aerror(
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            logger.error(
                 "request_error",
                 request_id=request_id,
                 method=method,
@@ -40,29 +78,18 @@ class AuditMiddleware(BaseHTTPMiddleware):
                 latency_ms=latency_ms
             )
             raise
-    
-    async def _log_inbound(self, request: Request, request_id: str, method: str, path: str):
-        safe_headers = {}
-        unsafe_header_keys = {"authorization", "x-api-key", "cookie", "x-token"}
-        
-        for key, value in request.headers.items():
-            if key.lower() not in unsafe_header_keys:
-                safe_headers[key] = value
-        
-        body_size = 0
-        if method in ["POST", "PUT", "PATCH"]:
-            try:
-                body = await request.body()
-                body_size = len(body)
-                
-                # For logging, truncate body
-                body_preview = body.decode("utf-8", errors="ignore")[:settings.LOG_BODY_LIMIT]
-            except:
-                body_preview = ""
-        else:
-            body_preview = ""
-        
-        await logger.ainfo(
+
+    def _log_inbound(self, request: Request, request_id: str, method: str, path: str, body: bytes, body_size: int):
+        safe_headers = {
+            key: value
+            for key, value in request.headers.items()
+            if key.lower() not in _UNSAFE_HEADERS
+        }
+
+        # For logging, truncate body
+        body_preview = body.decode("utf-8", errors="ignore")[:settings.LOG_BODY_LIMIT]
+
+        logger.info(
             "inbound_request",
             request_id=request_id,
             method=method,
@@ -71,8 +98,8 @@ class AuditMiddleware(BaseHTTPMiddleware):
             body_size=body_size,
             body_preview=body_preview if body_preview else None
         )
-    
-    async def _log_outbound(self, response: Response, request_id: str, latency_ms: int):
+
+    def _log_outbound(self, response: Response, request_id: str, latency_ms: int):
         if isinstance(response, (StreamingResponse, FileResponse)):
             body_size = 0
         elif hasattr(response, 'body'):
@@ -80,29 +107,22 @@ class AuditMiddleware(BaseHTTPMiddleware):
         else:
             body_size = 0
 
-        await logger.ainfo(
+        logger.info(
             "outbound_response",
             request_id=request_id,
             status_code=response.status_code,
             body_size=body_size,
             latency_ms=latency_ms
         )
-        
-    async def _get_or_generate_request_id(self, request: Request) -> str:
+
+    def _get_or_generate_request_id(self, request: Request, parsed_body: Optional[dict]) -> str:
         request_id = request.headers.get("X-Request-ID")
         if request_id:
             return request_id
-        
-        if request.method in ["POST", "PUT", "PATCH"]:
-            try:
-                body = await request.body()
-                if body:
-                    data = json.loads(body)
-                    if isinstance(data, dict) and "requestId" in data:
-                        return data["requestId"]
-            except (json.JSONDecodeError, Exception):
-                pass
-        
-        return str(uuid.uuid4())
 
+        if isinstance(parsed_body, dict) and "requestId" in parsed_body:
+            return parsed_body["requestId"]
 
+        # Correlation-only ID: dash-less hex from one urandom syscall is
+        # several times cheaper than building a full uuid.UUID.
+        return urandom(16).hex()
@@ -1,38 +1,53 @@
+import sys
 from typing import Optional, Literal
-from pydantic import BaseModel, Field
-from uuid import uuid4
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from os import urandom
 
 
 class ListLeaguesPayload(BaseModel):
     """GET /api/getavailableleagues"""
-    pass
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
 
 class GetLeagueMatchesPayload(BaseModel):
     """GET /api/getmatchdata/{leagueId} or /{leagueId}/{season}"""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     leagueId: int = Field(..., gt=0, description="League ID")
     season: int = Field(..., gt=0, description="League ID")
 
 
 class GetTeamPayload(BaseModel):
     """GET /api/getteam/{teamId}"""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     teamId: int = Field(..., gt=0, description="Team ID")
 
 
 class GetMatchPayload(BaseModel):
     """GET /api/getmatchdata/{teamId1}/{teamId2}"""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     teamId1: int = Field(..., gt=0, description="Team 1 ID")
     teamId2: int = Field(..., gt=0, description="Team 2 ID")
 
 
+# Keys interned so hot-path lookups resolve on pointer equality; the
+# order matches the Literal in ProxyRequest.operationType.
 OPERATION_PAYLOAD_MAP = {
-    "ListLeagues": ListLeaguesPayload,
-    "GetLeagueMatches": GetLeagueMatchesPayload,
-    "GetTeam": GetTeamPayload,
-    "GetMatch": GetMatchPayload
+    sys.intern("ListLeagues"): ListLeaguesPayload,
+    sys.intern("GetLeagueMatches"): GetLeagueMatchesPayload,
+    sys.intern("GetTeam"): GetTeamPayload,
+    sys.intern("GetMatch"): GetMatchPayload
+}
+
+# TypeAdapters built once at import time; validate_python goes straight
+# to the compiled pydantic-core validator instead of the __init__ wrapper.
+OPERATION_PAYLOAD_VALIDATORS = {
+    op: TypeAdapter(cls) for op, cls in OPERATION_PAYLOAD_MAP.items()
 }
 
-VALID_OPERATIONS = set(OPERATION_PAYLOAD_MAP.keys())
+VALID_OPERATIONS = frozenset(OPERATION_PAYLOAD_MAP)
 
 
 class ProxyRequest(BaseModel):
@@ -44,7 +59,7 @@ class ProxyRequest(BaseModel):
     ] = Field(..., description="Type of operation to execute")
 
     requestId: Optional[str] = Field(
-        default_factory=lambda: str(uuid4()),
+        default_factory=lambda: urandom(16).hex(),
         description="Unique request ID (auto-generated if not provided)"
     )
 
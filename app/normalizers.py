@@ -0,0 +1,66 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _final_score(match_results: Optional[list]) -> Tuple[Optional[int], Optional[int]]:
+    """Pull the final score out of an OpenLigaDB MatchResults list."""
+    if not match_results:
+        return None, None
+
+    last = match_results[-1]
+    return last.get("PointsTeam1"), last.get("PointsTeam2")
+
+
+def _normalize_pascal_match(m: Dict[str, Any]) -> Dict[str, Any]:
+    """Build one MatchData dict from an OpenLigaDB PascalCase match."""
+    goals1, goals2 = _final_score(m.get("MatchResults"))
+    return {
+        "id": m["MatchID"],
+        "team1": (m.get("Team1") or {}).get("TeamName", ""),
+        "team2": (m.get("Team2") or {}).get("TeamName", ""),
+        "date": m.get("MatchDateTimeUTC", ""),
+        "status": "finished" if m.get("MatchIsFinished") else "scheduled",
+        "goals1": goals1,
+        "goals2": goals2,
+    }
+
+
+def normalize_matches(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Normalize raw match data to the MatchData shape.
+
+    The schema variant is detected once on the first element, then a
+    single specialized list comprehension handles the whole response —
+    no per-match key probing or chained `or` fallbacks.
+    """
+    if not data:
+        return []
+
+    # OpenLigaDB PascalCase payload
+    if "MatchID" in data[0]:
+        return [_normalize_pascal_match(m) for m in data]
+
+    # Already lowercase/canonical
+    return data
+
+
+def normalize_leagues(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Normalize raw league data to the LeagueData shape.
+
+    Same single-pass specialization as normalize_matches.
+    """
+    if not data:
+        return []
+
+    if "LeagueId" in data[0]:
+        return [
+            {
+                "id": league["LeagueId"],
+                "name": league.get("LeagueName", ""),
+                "shortcut": league.get("LeagueShortcut", ""),
+                "season": league.get("LeagueSeason"),
+            }
+            for league in data
+        ]
+
+    return data
@@ -1,48 +1,101 @@
 import structlog
-from fastapi import APIRouter, HTTPException, status
+from datetime import datetime, timezone
+from fastapi import APIRouter, HTTPException, Request, status
+from pydantic import ValidationError
 from app.models.requests import ProxyRequest
-from app.models.responses import SuccessResponse, ErrorResponse, ResponseMetadata
-from app.adapters.manager import get_adapter
-from app.decision_mapper import DecisionMapper
-from app.utils.validators import validate_operation_type, validate_payload 
-from app.config import settings
+from app.models.responses import SuccessResponse, ErrorResponse
+from app.utils.orjson_response import ORJSONResponse
+from app.exceptions import ProxyError
+from app.utils.validators import validate_operation_type, validate_payload_with, format_validation_errors
+from app.utils.async_log import log_event
+from app.middleware.audit import REQUEST_ID_CTX
 
 
 logger = structlog.get_logger()
 router = APIRouter(prefix="/proxy", tags=["proxy"])
 
-_mapper = None
+# Bound pydantic-core validator: parses and validates the envelope from
+# raw bytes in one Rust-side pass.
+_validate_proxy_request_json = ProxyRequest.__pydantic_validator__.validate_json
 
-async def get_mapper():
-    """Get or initialize decision mapper with adapter."""
-    global _mapper
-    if _mapper is None:
-        adapter = await get_adapter('openliga', settings)
-        _mapper = DecisionMapper(adapter)
-    return _mapper
+# Static inner error payload shared across requests (treated as
+# immutable); the varying-message errors still build theirs inline.
+_INTERNAL_ERROR = {
+    "code": "INTERNAL_ERROR",
+    "message": "Internal server error",
+    "details": None
+}
+
+
+def _error_body(request_id: str, error: dict) -> dict:
+    """Assemble the standard error envelope around a prepared error dict."""
+    return {
+        "requestId": request_id,
+        "success": False,
+        "error": error
+    }
 
 
 @router.post(
     "/execute",
-    response_model=SuccessResponse | ErrorResponse,
-    status_code=200
+    status_code=200,
+    # Documented via responses= instead of response_model= so FastAPI
+    # doesn't re-validate and jsonable_encoder-walk every return value.
+    responses={
+        200: {"model": SuccessResponse},
+        400: {"model": ErrorResponse},
+        502: {"model": ErrorResponse}
+    },
+    # The raw-Request signature hides the body from FastAPI's signature
+    # inspection, so the envelope schema is attached to the OpenAPI
+    # operation explicitly — /docs keeps showing the full contract.
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {"schema": ProxyRequest.model_json_schema()}
+            },
+            "required": True
+        }
+    }
 )
-async def execute_proxy(request: ProxyRequest):
+async def execute_proxy(raw_request: Request):
     """
     Main reverse proxy endpoint.
+
+    Takes the raw request so the envelope is validated straight from the
+    body bytes (already buffered by AuditMiddleware), skipping FastAPI's
+    json -> dict -> model kwargs round-trip.
     """
+    body = raw_request.state.raw_body or await raw_request.body()
+
+    try:
+        request = _validate_proxy_request_json(body)
+    except ValidationError as e:
+        raise ProxyError(
+            status.HTTP_400_BAD_REQUEST,
+            _error_body(REQUEST_ID_CTX.get(), {
+                "code": "VALIDATION_ERROR",
+                "message": "Invalid request envelope",
+                "details": format_validation_errors(e)
+            })
+        )
+
     request_id = request.requestId
     operation_type = request.operationType
     payload = request.payload
     
-    await logger.ainfo(
+    logger.debug(
         "proxy_request_received",
         request_id=request_id,
         operation_type=operation_type
     )
     
-    is_valid, validation_error = validate_operation_type(operation_type)
-    if not is_valid:
+    # One fused dispatch lookup resolves operation existence, the payload
+    # validator and the adapter executor together.
+    mapper = raw_request.app.state.mapper
+    entry = mapper.dispatch(operation_type)
+    if entry is None:
+        _, validation_error = validate_operation_type(operation_type)
         await logger.awarning(
             "validation_failed",
             request_id=request_id,
@@ -50,20 +103,17 @@ async def execute_proxy(request: ProxyRequest):
             error_type="unknown_operation_type",
             error_message=validation_error
         )
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "requestId": request_id,
-                "success": False,
-                "error": {
-                    "code": "UNKNOWN_OPERATION",
-                    "message": validation_error,
-                    "details": None
-                }
-            }
+        raise ProxyError(
+            status.HTTP_400_BAD_REQUEST,
+            _error_body(request_id, {
+                "code": "UNKNOWN_OPERATION",
+                "message": validation_error,
+                "details": None
+            })
         )
     
-    is_valid, validation_error, error_details, validated_payload = validate_payload(operation_type, payload)
+    validator, execute_op, normalize = entry
+    is_valid, validation_error, error_details, validated_payload = validate_payload_with(validator, operation_type, payload)
     if not is_valid:
         await logger.awarning(
             "validation_failed",
@@ -73,38 +123,17 @@ async def execute_proxy(request: ProxyRequest):
             error_message=validation_error,
             error_details=error_details
         )
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "requestId": request_id,
-                "success": False,
-                "error": {
-                    "code": "VALIDATION_ERROR",
-                    "message": validation_error,
-                    "details": error_details
-                }
-            }
+        raise ProxyError(
+            status.HTTP_400_BAD_REQUEST,
+            _error_body(request_id, {
+                "code": "VALIDATION_ERROR",
+                "message": validation_error,
+                "details": error_details
+            })
         )
     
-    await logger.ainfo(
-        "validation_passed",
-        request_id=request_id,
-        operation_type=operation_type
-    )
-    
     try:
-        mapper = await get_mapper()
-        adapter_response = await mapper.execute(operation_type, validated_payload)
-        
-        await logger.ainfo(
-            "upstream_call",
-            request_id=request_id,
-            operation_type=operation_type,
-            provider="openliga",
-            target_url=adapter_response.upstream_url,
-            status_code=adapter_response.status_code,
-            latency_ms=adapter_response.latency_ms
-        )
+        adapter_response = await execute_op(validated_payload)
         
         if adapter_response.status_code != 200:
             await logger.aerror(
@@ -114,41 +143,52 @@ async def execute_proxy(request: ProxyRequest):
                 status_code=adapter_response.status_code,
                 error=adapter_response.data
             )
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail={
-                    "requestId": request_id,
-                    "success": False,
-                    "error": {
-                        "code": "UPSTREAM_ERROR",
-                        "message": "Upstream API failed after retries",
-                        "details": adapter_response.data
-                    }
-                }
+            raise ProxyError(
+                status.HTTP_502_BAD_GATEWAY,
+                _error_body(request_id, {
+                    "code": "UPSTREAM_ERROR",
+                    "message": "Upstream API failed after retries",
+                    "details": adapter_response.data
+                })
             )
         
-        metadata = ResponseMetadata(
-            provider="openliga",
-            upstreamLatency=adapter_response.latency_ms
-        )
-        
-        success_response = SuccessResponse(
-            requestId=request_id,
-            success=True,
-            data=adapter_response.data,
-            metadata=metadata
-        )
+        # Normalize only when the operation has a normalizer and the
+        # payload is a list; pass-through shapes skip the walk.
+        data = adapter_response.data
+        if normalize is not None and type(data) is list:
+            data = normalize(data)
+
+        # Plain dict straight into ORJSONResponse: orjson handles the
+        # datetime natively and we skip Pydantic model construction plus
+        # FastAPI's jsonable_encoder walk over every data item.
+        success_response = {
+            "requestId": request_id,
+            "success": True,
+            "data": data,
+            "metadata": {
+                "provider": "openliga",
+                "upstreamLatency": adapter_response.latency_ms,
+                "timestamp": datetime.now(timezone.utc)
+            }
+        }
         
-        await logger.ainfo(
-            "proxy_request_success",
+        # Single terminal event for the whole request, handed to the
+        # background drain task so rendering and the stderr write happen
+        # off this coroutine.
+        log_event(
+            "proxy_request_done",
             request_id=request_id,
             operation_type=operation_type,
-            data_items=len(adapter_response.data) if isinstance(adapter_response.data, list) else 1
+            provider="openliga",
+            target_url=adapter_response.upstream_url,
+            upstream_status=adapter_response.status_code,
+            upstream_latency_ms=adapter_response.latency_ms,
+            data_items=len(data) if type(data) is list else 1
         )
         
-        return success_response
+        return ORJSONResponse(success_response)
     
-    except HTTPException:
+    except (HTTPException, ProxyError):
         raise
     
     except Exception as e:
@@ -159,15 +199,7 @@ async def execute_proxy(request: ProxyRequest):
             error=str(e),
             error_type=type(e).__name__
         )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "requestId": request_id,
-                "success": False,
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": "Internal server error",
-                    "details": None
-                }
-            }
+        raise ProxyError(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            _error_body(request_id, _INTERNAL_ERROR)
         )
\ No newline at end of file
@@ -0,0 +1,28 @@
+import asyncio
+import structlog
+
+logger = structlog.get_logger()
+
+# Bounded so a stalled sink back-pressures into drops, never into
+# request latency.
+LOG_Q: asyncio.Queue = asyncio.Queue(maxsize=10_000)
+
+
+def log_event(event: str, **kv):
+    """Queue a structured event without blocking; dropped if the queue is full."""
+    try:
+        LOG_Q.put_nowait({"event": event, **kv})
+    except asyncio.QueueFull:
+        pass
+
+
+async def drain_log_queue():
+    """
+    Render and emit queued events.
+
+    Runs as a lifespan background task so JSON rendering and the stderr
+    write happen off the serving coroutines.
+    """
+    while True:
+        evt = await LOG_Q.get()
+        logger.info(evt.pop("event"), **evt)
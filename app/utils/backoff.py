@@ -1,5 +1,10 @@
 import random
 
+# OS-seeded so forked workers don't share a seed and wake in lockstep.
+# The bound method is cached to skip the global + attribute lookup per call.
+_rand = random.SystemRandom().random
+
+
 def exponential_backoff(
     retry_count: int,
     base_delay: float = 1.0,
@@ -7,20 +12,26 @@ def exponential_backoff(
     jitter: bool = True
 ) -> float:
     """
-    Calculate exponential backoff delay with optional jitter.
-    
+    Calculate exponential backoff delay with full jitter (AWS style).
+
+    With jitter the delay is drawn uniformly from [0, cap] rather than
+    jittered around the cap, so retries from concurrent requests spread
+    out instead of hammering the upstream in synchronized waves.
+
     Args:
         retry_count: Number of retries so far (0-based)
         base_delay: Base delay in seconds
         max_delay: Maximum delay in seconds
-        jitter: Whether to add random jitter
-    
+        jitter: Whether to apply full jitter
+
     Returns:
         Delay in seconds
     """
-    delay = min(base_delay * (2 ** retry_count), max_delay)
-    
+    # 1 << n is a single opcode vs BINARY_POWER; capping the shift at 30
+    # keeps the intermediate int word-sized even for absurd retry counts.
+    cap = min(base_delay * (1 << min(retry_count, 30)), max_delay)
+
     if jitter:
-        delay = random.uniform(0, delay)
-    
-    return delay
\ No newline at end of file
+        return cap * _rand()
+
+    return cap
@@ -0,0 +1,11 @@
+import orjson
+from fastapi import Response
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered by orjson instead of stdlib json.dumps."""
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -1,6 +1,4 @@
 import time
-from collections import deque
-from typing import Deque
 import structlog
 
 from fastapi import HTTPException, status
@@ -10,56 +8,65 @@ logger = structlog.get_logger()
 
 
 class RateLimiter:
+    """
+    Lock-free token bucket.
+
+    Refill and consume happen in plain synchronous code with no await
+    between the read and the write, so on a single asyncio event loop
+    the update is atomic without any lock — concurrent _fetch calls
+    never serialize on the limiter.
+    """
+
     def __init__(self, limit: int, window: int):
         """
         Initialize rate limiter.
-        
+
         Args:
-            rpm: Requests per minute limit
+            limit: Maximum requests per window (also the burst capacity)
+            window: Window length in seconds
         """
         self.limit = limit
-        self.requests: Deque[float] = deque()
-        self.window = window 
-    
+        self.window = window
+        self.rate = limit / window
+        self.capacity = float(limit)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+
+    def _refill(self):
+        """Add tokens accrued since the last refill, capped at capacity."""
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.last_refill = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+
     def is_allowed(self) -> bool:
         """
         Check if request is allowed.
-        
+
         Returns:
-            True if request is within rate limit, False otherwise
+            True if a token was consumed, False if the bucket is empty
         """
-        current_time = time.monotonic()
-        
-        while self.requests and self.requests[0] < current_time - self.window:
-            self.requests.popleft()
-        
-        # Check if we're within limit
-        if len(self.requests) < self.limit:
-            self.requests.append(current_time)
+        self._refill()
+
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
             return True
-        
+
         return False
-    
+
     def get_remaining(self) -> int:
         """Get number of remaining requests in current window."""
-        current_time = time.monotonic()
-        
-        # Remove old requests
-        while self.requests and self.requests[0] < current_time - self.window:
-            self.requests.popleft()
-        
-        return max(0, self.limit - len(self.requests))
-    
+        self._refill()
+        return int(self.tokens)
+
     def get_reset_time(self) -> float:
-        """Get time until rate limit resets (in seconds)."""
-        if not self.requests:
+        """Get time until the next token becomes available (in seconds)."""
+        self._refill()
+
+        if self.tokens >= 1.0:
             return 0
-        
-        current_time = time.monotonic()
-        oldest_request = self.requests[0]
-        reset_time = oldest_request + self.window - current_time
-        
-        return max(0, reset_time)
+
+        return (1.0 - self.tokens) / self.rate
 
 
 async def check_rate_limit(rate_limiter: RateLimiter, adapter_name: str, request_id: str = ""):
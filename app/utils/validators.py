@@ -1,48 +1,57 @@
 from typing import Tuple, Dict, Any, Optional
 from pydantic import ValidationError
-from app.models.requests import OPERATION_PAYLOAD_MAP
+from app.models.requests import VALID_OPERATIONS
+
+_VALID_OPS_STR = ", ".join(sorted(VALID_OPERATIONS))
 
 
 def validate_operation_type(operation_type: str) -> Tuple[bool, Optional[str]]:
     """
     Validate operation type is supported.
-    
+
     Returns:
         (is_valid, error_message)
     """
-    if operation_type not in OPERATION_PAYLOAD_MAP:
-        valid_ops = ", ".join(OPERATION_PAYLOAD_MAP.keys())
-        return False, f"Unknown operationType '{operation_type}'. Valid: {valid_ops}"
-    
-    return True, None
+    if operation_type in VALID_OPERATIONS:
+        return True, None
+
+    return False, f"Unknown operationType '{operation_type}'. Valid: {_VALID_OPS_STR}"
+
+
+def format_validation_errors(e: ValidationError) -> Dict[str, Any]:
+    """Render a ValidationError into the field -> {type, message} shape."""
+    # Skip the url/input/context fields pydantic-core would otherwise
+    # format — the response renderer never uses them.
+    errors = e.errors(include_url=False, include_input=False, include_context=False)
+    error_dict = {}
+
+    for error in errors:
+        loc = error["loc"]
+        field = str(loc[0]) if len(loc) == 1 else ".".join(map(str, loc))
+        error_dict[field] = {
+            "type": error["type"],
+            "message": error["msg"]
+        }
 
+    return error_dict
 
-def validate_payload(operation_type: str, payload: Dict[str, Any]) -> Tuple[bool, Optional[str], Optional[Dict[str, Any]]]:
+
+def validate_payload_with(validate_fn, operation_type: str, payload: Dict[str, Any]):
     """
-    Validate payload against operation schema.
-    
+    Validate payload with an already-resolved validator callable
+    (a bound TypeAdapter.validate_python).
+
+    Lets callers that looked the validator up as part of a fused
+    dispatch entry skip the second per-request dict lookup here.
+
     Returns:
-        (is_valid, error_message, validation_errors_dict)
+        (is_valid, error_message, validation_errors_dict, validated_payload)
     """
-    payload_model = OPERATION_PAYLOAD_MAP.get(operation_type)
-    
-    if not payload_model:
-        return False, "Unknown operation type", None, None 
-    
     try:
-        validated = payload_model(**payload)
+        validated = validate_fn(payload)
         return True, None, None, validated
     
     except ValidationError as e:
-        errors = e.errors()
-        error_dict = {}
-        
-        for error in errors:
-            field = ".".join(str(x) for x in error["loc"])
-            error_dict[field] = {
-                "type": error["type"],
-                "message": error["msg"]
-            }
-        
         error_msg = f"Payload validation failed for {operation_type}"
-        return False, error_msg, error_dict, None
\ No newline at end of file
+        return False, error_msg, format_validation_errors(e), None
+
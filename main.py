@@ -1,34 +1,77 @@
+import asyncio
+import logging
+import orjson
 import structlog
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
 from app.config import settings
+from app.utils.orjson_response import ORJSONResponse
 from app.routes.proxy import router as proxy_router
-from app.middleware.audit import AuditMiddleware
-from app.adapters.manager import register_adapter
+from app.middleware.audit import AuditMiddleware, REQUEST_ID_CTX
+from app.adapters.manager import register_adapter, get_adapter, close_adapters
 from app.adapters.openligadb import OpenLigaDBAdapter
+from app.decision_mapper import DecisionMapper
+from app.utils.async_log import drain_log_queue
+from app.exceptions import ProxyError
 
 register_adapter('openliga', OpenLigaDBAdapter)
 
 structlog.configure(
     processors=[
-        structlog.processors.JSONRenderer()
+        # orjson renders the event dict in native code and returns bytes,
+        # which BytesLoggerFactory writes straight to the stream — no
+        # str round-trip, no print() machinery.
+        structlog.processors.JSONRenderer(serializer=orjson.dumps, default=str)
     ],
-    logger_factory=structlog.PrintLoggerFactory(),
+    # Filtering wrapper drops sub-INFO events before the processor chain
+    # runs, so DEBUG logging on the hot path costs one level check.
+    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+    logger_factory=structlog.BytesLoggerFactory(),
 )
 
 logger = structlog.get_logger()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Built eagerly so the hot path reads one attribute instead of
+    # racing a lazily-initialized global under the first burst.
+    app.state.mapper = DecisionMapper(get_adapter('openliga', settings))
+    log_drain = asyncio.create_task(drain_log_queue())
+    yield
+    log_drain.cancel()
+    await close_adapters()
+
+
 app = FastAPI(
     title="OpenLiga Reverse Proxy",
     description="Generic reverse proxy to OpenLigaDB API",
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(AuditMiddleware)
 
+if settings.DEBUG:
+    from pyinstrument import Profiler
+    from fastapi.responses import HTMLResponse
+
+    @app.middleware("http")
+    async def profile_request(request, call_next):
+        """Opt-in profiler: add ?profile=1 to any request (DEBUG only)."""
+        if request.query_params.get("profile") != "1":
+            return await call_next(request)
+
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        await call_next(request)
+        profiler.stop()
+        return HTMLResponse(profiler.output_html())
+
 @app.get("/health")
 async def health_check():
     return {
@@ -39,22 +82,31 @@ async def health_check():
 
 app.include_router(proxy_router)
 
+@app.exception_handler(ProxyError)
+async def proxy_error_handler(request, exc):
+    """Serialize ProxyError bodies straight through orjson."""
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content=exc.body
+    )
+
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """Handle HTTP exceptions with structured response."""
     
     # If detail is already a dict (from our code), use it
     if isinstance(exc.detail, dict):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content=exc.detail
         )
     
     # Otherwise, wrap in error response
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
-            "requestId": request.headers.get("X-Request-ID", "unknown"),
+            "requestId": REQUEST_ID_CTX.get(),
             "success": False,
             "error": {
                 "code": "HTTP_ERROR",
@@ -75,10 +127,10 @@ async def general_exception_handler(request, exc):
         error_type=type(exc).__name__
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
-            "requestId": request.headers.get("X-Request-ID", "unknown"),
+            "requestId": REQUEST_ID_CTX.get(),
             "success": False,
             "error": {
                 "code": "INTERNAL_ERROR",
@@ -90,10 +142,18 @@ async def general_exception_handler(request, exc):
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
     uvicorn.run(
-        app,
+        "main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        loop="uvloop",
+        http="httptools",
+        workers=1 if settings.DEBUG else (os.cpu_count() or 1),
+        # AuditMiddleware already emits structured in/out events; uvicorn's
+        # access log would duplicate them at a stdlib logging call each.
+        access_log=False,
+        log_config=None
     )
\ No newline at end of file